@@ -3,7 +3,8 @@ __version__ = "1.1.14"
 import logging
 import sys
 
-# Configure default logging for all loggers in the package
+# Configure default logging for all loggers in the package.
+# The module loggers propagate their records to the package logger.
 handler = logging.StreamHandler(sys.stdout)
 handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
@@ -11,9 +12,3 @@ handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s -
 logger = logging.getLogger(__name__)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
-
-# Configure all module loggers
-for module_name in ['dao', 'ormatic', 'sqlalchemy_generator']:
-    module_logger = logging.getLogger(f"{__name__}.{module_name}")
-    module_logger.addHandler(handler)
-    module_logger.setLevel(logging.INFO)
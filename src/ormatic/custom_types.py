@@ -1,9 +1,31 @@
 import importlib
+from functools import lru_cache
 from typing import Type, Optional
 
 from sqlalchemy import TypeDecorator
 from sqlalchemy import types
 
+
+@lru_cache(maxsize=4096)
+def type_to_name(value: Type) -> str:
+    """
+    :param value: The class to get the name of.
+    :return: The fully qualified name of the class.
+    """
+    return value.__module__ + "." + value.__name__
+
+
+@lru_cache(maxsize=4096)
+def name_to_type(value: str) -> Type:
+    """
+    :param value: The fully qualified name of a class.
+    :return: The class with that name, imported from its module.
+    """
+    module_name, class_name = value.rsplit('.', 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
 class TypeType(TypeDecorator):
     """
     Type that casts fields that are of type `type` to their class name on serialization and converts the name
@@ -11,13 +33,14 @@ class TypeType(TypeDecorator):
     """
     impl = types.String(256)
 
-    def process_bind_param(self, value: Type, dialect):
-        return value.__module__ + "." + value.__name__
+    def process_bind_param(self, value: Optional[Type], dialect) -> Optional[str]:
+        if value is None:
+            return None
+
+        return type_to_name(value)
 
     def process_result_value(self, value: impl, dialect) -> Optional[Type]:
         if value is None:
             return None
 
-        module_name, class_name = str(value).rsplit('.', 1)
-        module = importlib.import_module(module_name)
-        return getattr(module, class_name)
+        return name_to_type(str(value))
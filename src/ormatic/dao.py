@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import inspect
+import keyword
 import logging
+import operator
 import threading
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Optional, List
+from typing import Optional, Tuple, FrozenSet, Iterable, List, Callable, Generator
 
 import sqlalchemy.inspection
 import sqlalchemy.orm
@@ -12,14 +15,50 @@ from sqlalchemy import Column
 from sqlalchemy.orm import MANYTOONE, ONETOMANY, RelationshipProperty
 from typing_extensions import Type, get_args, Dict, Any, TypeVar, Generic
 
-from .utils import recursive_subclasses
-
 logger = logging.getLogger(__name__)
-_repr_thread_local = threading.local()
+
+
+class _ReprThreadLocal(threading.local):
+    """
+    The ids of the DAOs that are currently being represented in the calling thread.
+    """
+
+    def __init__(self):
+        self.seen = set()
+
+
+_repr_thread_local = _ReprThreadLocal()
 
 T = TypeVar('T')
 _DAO = TypeVar("_DAO", bound="DataAccessObject")
 
+_dao_classes: Dict[Type, Type[DataAccessObject]] = {}
+"""
+Index that maps original classes to the DAO class that was defined for them.
+It is filled when a DataAccessObject subclass is created.
+"""
+
+_alternative_mappings: Dict[Type, Type[AlternativeMapping]] = {}
+"""
+Index that maps original classes to the AlternativeMapping that was defined for them.
+It is filled when an AlternativeMapping subclass is created.
+"""
+
+
+def _register_original_class(index: Dict[Type, Type], cls: Type):
+    """
+    Register `cls` in `index` under its original class.
+    The first registered class wins, such that subclasses that do not parameterize their generic
+    do not shadow their parents.
+
+    :param index: The index to register the class in.
+    :param cls: The DataAccessObject or AlternativeMapping subclass.
+    """
+    try:
+        index.setdefault(cls.original_class(), cls)
+    except NoGenericError:
+        pass
+
 
 class NoGenericError(TypeError):
     """
@@ -76,15 +115,215 @@ def is_data_column(column: Column):
     return not column.primary_key and len(column.foreign_keys) == 0 and column.name != "polymorphic_type"
 
 
+@dataclass(frozen=True)
+class ConversionPlan:
+    """
+    Information about a DAO class that is needed to convert objects to DAOs and back.
+    It only depends on the DAO class and is hence computed once per class, see `DataAccessObject.conversion_plan`.
+    """
+
+    __slots__ = ("mapper", "data_columns", "relationships", "argument_names", "attribute_names",
+                 "unmapped_argument_names", "copy_data_columns", "copy_attributes", "repr_data_columns",
+                 "alternative_mapping", "alternatively_mapped_base", "argument_data_columns",
+                 "get_argument_data_columns")
+
+    mapper: sqlalchemy.orm.Mapper
+    """
+    The mapper of the DAO class.
+    """
+
+    data_columns: Tuple[str, ...]
+    """
+    The names of the columns that contain data, see `is_data_column`.
+    """
+
+    relationships: Tuple[Tuple[RelationshipProperty, bool], ...]
+    """
+    The relationships of the DAO class paired with a flag that is True if the relationship refers to a single
+    object and False if it refers to a collection of objects.
+    """
+
+    argument_names: FrozenSet[str]
+    """
+    The names of the arguments of the `__init__` method of the original class.
+    """
+
+    attribute_names: FrozenSet[str]
+    """
+    The names of the data columns and relationships of the DAO class.
+    """
+
+    unmapped_argument_names: FrozenSet[str]
+    """
+    The names of the arguments of the `__init__` method of the original class that are neither a data column nor a
+    relationship of the DAO class.
+    """
+
+    copy_data_columns: Callable[[Any, Any], None]
+    """
+    Function that copies the data columns from a source object to a target object, see `compile_column_copy`.
+    """
+
+    copy_attributes: Callable[[Any, Any], None]
+    """
+    Function that copies the data columns and the relationships from a source object to a target object without
+    converting the related objects, see `compile_column_copy`.
+    """
+
+    repr_data_columns: Callable[[Any], List[str]]
+    """
+    Function that formats the data columns of an object as `name=value` strings, see `compile_column_repr`.
+    """
+
+    alternative_mapping: Optional[Type[AlternativeMapping]]
+    """
+    The original class if it is an alternative mapping, None otherwise.
+    """
+
+    alternatively_mapped_base: Optional[Type[DataAccessObject]]
+    """
+    The DAO class this DAO class inherits from if that DAO class is the DAO of an alternative mapping, None otherwise.
+    """
+
+    argument_data_columns: Tuple[str, ...]
+    """
+    The names of the data columns that are arguments of the `__init__` method of the original class.
+    """
+
+    get_argument_data_columns: Callable[[Any], Tuple[Any, ...]]
+    """
+    Function that gets the values of the argument data columns of an object, see `compile_column_get`.
+    """
+
+
+@dataclass(frozen=True)
+class SubclassConversionPlan:
+    """
+    Information about a DAO class of a subclass of an alternatively mapped class that is needed to convert objects
+    to DAOs. It only depends on the DAO class and the DAO class of its parent and is hence computed once per pair,
+    see `DataAccessObject.subclass_conversion_plan`.
+    """
+
+    __slots__ = ("own_data_columns", "copy_own_data_columns", "own_relationships")
+
+    own_data_columns: Tuple[str, ...]
+    """
+    The names of the data columns that are defined by the DAO class but not by its parent.
+    """
+
+    copy_own_data_columns: Callable[[Any, Any], None]
+    """
+    Function that copies the own data columns from a source object to a target object, see `compile_column_copy`.
+    """
+
+    own_relationships: Tuple[Tuple[RelationshipProperty, bool], ...]
+    """
+    The relationships that are defined by the DAO class but not by its parent, see `ConversionPlan.relationships`.
+    """
+
+
+def init_argument_names(cls: Type) -> FrozenSet[str]:
+    """
+    Get the names of the arguments of the `__init__` method of a class.
+
+    :param cls: The class to get the argument names of.
+    :return: The names of the arguments except `self`.
+    """
+    return frozenset([p.name for p in inspect.signature(cls.__init__).parameters.values()][1:])
+
+
+def compile_column_repr(columns: Tuple[str, ...]) -> Callable[[Any], List[str]]:
+    """
+    Compile a function that formats the given columns of an object as `name=value` strings.
+    The function consists of a single list display with one formatted string per column.
+
+    :param columns: The names of the columns to format.
+    :return: A function that takes an object and returns the formatted columns in the order of the names.
+    """
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name in columns):
+        def repr_columns(source):
+            return [f"{name}={repr(getattr(source, name))}" for name in columns]
+        return repr_columns
+
+    items = ", ".join(f'f"{name}={{source.{name}!r}}"' for name in columns)
+    namespace = {}
+    exec(f"def repr_columns(source):\n    return [{items}]", namespace)
+    return namespace["repr_columns"]
+
+
+def compile_column_get(columns: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Create a function that gets the values of the given columns of an object using `operator.attrgetter`.
+
+    :param columns: The names of the columns to get.
+    :return: A function that takes an object and returns the values of the columns in the order of the names.
+    """
+    if not columns:
+        return lambda source: ()
+    if len(columns) == 1:
+        getter = operator.attrgetter(columns[0])
+        return lambda source: (getter(source),)
+    return operator.attrgetter(*columns)
+
+
+def compile_column_copy(columns: Tuple[str, ...]) -> Callable[[Any, Any], None]:
+    """
+    Compile a function that copies the given columns from a source object to a target object.
+    The function consists of one plain assignment per column, such that no loop and no `getattr`/`setattr` calls
+    are executed per column.
+
+    :param columns: The names of the columns to copy.
+    :return: A function that takes the target and the source object.
+    """
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name in columns):
+        def copy_columns(target, source):
+            for name in columns:
+                setattr(target, name, getattr(source, name))
+        return copy_columns
+
+    body = [f"    target.{name} = source.{name}" for name in columns] or ["    pass"]
+    namespace = {}
+    exec("\n".join(["def copy_columns(target, source):"] + body), namespace)
+    return namespace["copy_columns"]
+
+
+def is_single_valued(relationship: RelationshipProperty) -> bool:
+    """
+    :param relationship: The relationship to check.
+    :return: True if the relationship refers to a single object instead of a collection.
+    """
+    return relationship.direction == MANYTOONE or (relationship.direction == ONETOMANY and not relationship.uselist)
+
+
+def _fill_worklist(worklist: List, memo: Dict[int, Any], keep_alive: Dict[int, Any]):
+    """
+    Fill the relationships of the DAOs in the worklist of a conversion until it is empty, see `DataAccessObject.to_dao`.
+
+    :param worklist: The list of (dao, source object, relationships) that still have to be filled.
+    :param memo: Dictionary that keeps track of already converted objects to avoid duplicate processing.
+    :param keep_alive: Dictionary to keep track of objects that should not be garbage collected during the conversion.
+    """
+    while worklist:
+        dao, source, relationships = worklist.pop()
+        dao._get_relationships_from(source, relationships, memo, keep_alive, worklist)
+
+
 class HasGeneric(Generic[T]):
 
+    _original_class: Optional[Type] = None
+    """
+    The original class of this class, resolved once when the class is created.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._original_class = cls._resolve_original_class()
+
     @classmethod
-    @lru_cache(maxsize=None)
-    def original_class(cls) -> Type:
+    def _resolve_original_class(cls) -> Optional[Type]:
         """
-        :return: The original class of this DAO.
+        :return: The generic parameter this class was created with or None if there is none.
         """
-        # Fall back to the original method for manually created classes
         try:
             # Look for DataAccessObject in the class's MRO (Method Resolution Order)
             for base_cls in cls.__mro__:
@@ -102,10 +341,19 @@ class HasGeneric(Generic[T]):
                 type_args = get_args(base)
                 if type_args:
                     return type_args[0]
+        except (AttributeError, IndexError, NameError):
+            pass
+        return None
 
+    @classmethod
+    def original_class(cls) -> Type:
+        """
+        :return: The original class of this DAO.
+        """
+        original_class = cls.__dict__.get("_original_class")
+        if original_class is None:
             raise NoGenericError(cls)
-        except (AttributeError, IndexError):
-            raise NoGenericError(cls)
+        return original_class
 
 
 class DataAccessObject(HasGeneric[T]):
@@ -117,6 +365,57 @@ class DataAccessObject(HasGeneric[T]):
     This class describes the necessary functionality.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_original_class(_dao_classes, cls)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def conversion_plan(cls) -> ConversionPlan:
+        """
+        :return: The conversion plan of this DAO class.
+        """
+        mapper: sqlalchemy.orm.Mapper = sqlalchemy.inspection.inspect(cls)
+        argument_names = init_argument_names(cls.original_class())
+        data_columns = tuple(column.name for column in mapper.columns if is_data_column(column))
+        relationships = tuple((relationship, is_single_valued(relationship)) for relationship in mapper.relationships)
+        argument_data_columns = tuple(name for name in data_columns if name in argument_names)
+        attribute_names = frozenset(data_columns) | frozenset(relationship.key for relationship, _ in relationships)
+        original_class = cls.original_class()
+        alternative_mapping = original_class if issubclass(original_class, AlternativeMapping) else None
+        base = cls.__bases__[0]
+        alternatively_mapped_base = base if (issubclass(base, DataAccessObject) and
+                                             issubclass(base.original_class(), AlternativeMapping)) else None
+        return ConversionPlan(mapper=mapper, data_columns=data_columns, relationships=relationships,
+                              argument_names=argument_names, attribute_names=attribute_names,
+                              unmapped_argument_names=argument_names - attribute_names,
+                              copy_data_columns=compile_column_copy(data_columns),
+                              copy_attributes=compile_column_copy(
+                                  data_columns + tuple(relationship.key for relationship, _ in relationships)),
+                              repr_data_columns=compile_column_repr(data_columns),
+                              alternative_mapping=alternative_mapping,
+                              alternatively_mapped_base=alternatively_mapped_base,
+                              argument_data_columns=argument_data_columns,
+                              get_argument_data_columns=compile_column_get(argument_data_columns))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def subclass_conversion_plan(cls, base: Type[DataAccessObject]) -> SubclassConversionPlan:
+        """
+        :param base: The DAO class of the alternatively mapped parent class.
+        :return: The conversion plan of the part of this DAO class that is not covered by the parent DAO class.
+        """
+        plan = cls.conversion_plan()
+        parent_plan = base.conversion_plan()
+        columns_of_parent = frozenset(parent_plan.data_columns)
+        keys_of_parent = frozenset(relationship.key for relationship, _ in parent_plan.relationships)
+        own_data_columns = tuple(name for name in plan.data_columns if name not in columns_of_parent)
+        own_relationships = tuple((relationship, single) for relationship, single in plan.relationships
+                                  if relationship.key not in keys_of_parent)
+        return SubclassConversionPlan(own_data_columns=own_data_columns,
+                                      copy_own_data_columns=compile_column_copy(own_data_columns),
+                                      own_relationships=own_relationships)
+
     @classmethod
     def to_dao(cls, obj: T, memo: Dict[int, Any] = None, keep_alive: Dict[int, Any] = None, register=True) -> _DAO:
         """
@@ -124,6 +423,10 @@ class DataAccessObject(HasGeneric[T]):
         objects are not processed multiple times by using a memoization technique. It also handles alternative
         mappings for objects and applies transformation logic based on class inheritance and mapping requirements.
 
+        The object graph is converted iteratively. Every reached object is converted by `create_dao`, which
+        fills the columns of the DAO and appends its relationships to a worklist. The worklist is processed
+        until every relationship is filled, such that deep object graphs do not exhaust the call stack.
+
         :param obj: Object to be converted into its DAO equivalent
         :param memo: Dictionary that keeps track of already converted objects to avoid duplicate processing.
             Defaults to None.
@@ -140,42 +443,88 @@ class DataAccessObject(HasGeneric[T]):
         if keep_alive is None:
             keep_alive = {}
 
-        original_obj_id = id(obj)
-        if id(obj) in memo:
-            result = memo[id(obj)]
+        worklist = []
+        result = cls.create_dao(obj, memo=memo, keep_alive=keep_alive, worklist=worklist, register=register)
 
-            # if the object is not the correct one (could happend when ids are reassigned)
-            if not isinstance(result, cls):
-                del memo[id(obj)]
-                # raise ValueError(f"Expected result to be of type {cls} but got {result}")
-            else:
-                return memo[id(obj)]
+        _fill_worklist(worklist, memo, keep_alive)
+
+        return result
+
+    @classmethod
+    def to_dao_bulk(cls, objs: Iterable[T], memo: Dict[int, Any] = None,
+                    keep_alive: Dict[int, Any] = None) -> List[_DAO]:
+        """
+        Converts many objects of the original class of this DAO class at once.
+        All objects share the memo and the relationship worklist, see `to_dao`, such that objects that are
+        referenced by several of them are converted only once.
+
+        :param objs: Objects to be converted into their DAO equivalent
+        :param memo: Dictionary that keeps track of already converted objects to avoid duplicate processing.
+        :param keep_alive: Dictionary to keep track of objects that should not be garbage collected during the conversion.
+        :return: The instances of this DAO class in the order of the objects.
+        """
+        if memo is None:
+            memo = {}
+
+        if keep_alive is None:
+            keep_alive = {}
+
+        worklist = []
+        result = [cls.create_dao(obj, memo=memo, keep_alive=keep_alive, worklist=worklist) for obj in objs]
+
+        _fill_worklist(worklist, memo, keep_alive)
+
+        return result
+
+    @classmethod
+    def create_dao(cls, obj: T, memo: Dict[int, Any], keep_alive: Dict[int, Any], worklist: List,
+                   register=True) -> _DAO:
+        """
+        Creates the DAO of an object and fills its columns.
+        The relationships of the DAO are not filled but appended to the worklist, see `to_dao`.
+
+        :param obj: Object to be converted into its DAO equivalent
+        :param memo: Dictionary that keeps track of already converted objects to avoid duplicate processing.
+        :param keep_alive: Dictionary to keep track of objects that should not be garbage collected during the conversion.
+        :param worklist: The list of (dao, source object, relationships) that still have to be filled.
+        :param register: Whether to register the DAO class in the memo.
+        :return: Instance of the DAO class (_DAO) that represents the input object after conversion
+        """
+        obj_id = id(obj)
+        result = memo.get(obj_id)
+        if result is not None:
+            # the exact type is the common case and cheaper to check than isinstance
+            if type(result) is cls or isinstance(result, cls):
+                return result
+
+            # the object is not the correct one (could happend when ids are reassigned)
+            del memo[obj_id]
+
+        plan = cls.conversion_plan()
 
         # apply alternative mapping if needed
-        if issubclass(cls.original_class(), AlternativeMapping):
-            dao_obj = cls.original_class().to_dao(obj, memo=memo, keep_alive=keep_alive)
+        if plan.alternative_mapping is not None:
+            dao_obj = plan.alternative_mapping.to_dao(obj, memo=memo, keep_alive=keep_alive)
         else:
             dao_obj = obj
 
-        # get the primary inheritance route
-        base = cls.__bases__[0]
         result = cls()
 
         # register the result as in process
         if register:
-            #memo[id(obj)] = result
-            memo[original_obj_id] = result
-            keep_alive[original_obj_id] = obj
+            memo[obj_id] = result
+            keep_alive[obj_id] = obj
 
         # if the superclass of this dao is a DAO for an alternative mapping
-        if issubclass(base, DataAccessObject) and issubclass(base.original_class(), AlternativeMapping):
-            result.to_dao_if_subclass_of_alternative_mapping(obj=dao_obj, memo=memo, keep_alive=keep_alive, base=base)
+        if plan.alternatively_mapped_base is not None:
+            result.to_dao_if_subclass_of_alternative_mapping(obj=dao_obj, memo=memo, keep_alive=keep_alive,
+                                                             base=plan.alternatively_mapped_base, worklist=worklist)
         else:
-            result.to_dao_default(obj=dao_obj, memo=memo, keep_alive=keep_alive)
+            result.to_dao_default(obj=dao_obj, memo=memo, keep_alive=keep_alive, worklist=worklist)
 
         return result
 
-    def to_dao_default(self, obj: T, memo: Dict[int, Any], keep_alive: Dict[int, Any]):
+    def to_dao_default(self, obj: T, memo: Dict[int, Any], keep_alive: Dict[int, Any], worklist: List = None):
         """
         Converts the given object into a Data Access Object (DAO) representation
         by extracting column and relationship data. This method is primarily used
@@ -184,17 +533,16 @@ class DataAccessObject(HasGeneric[T]):
 
         :param obj: The source object to be converted into a DAO representation.
         :param memo: A dictionary to handle cyclic references by tracking processed objects.
-
+        :param keep_alive: A dictionary to ensure that objects remain in memory during the transformation.
+        :param worklist: The worklist the relationships are appended to. If None, the relationships are filled
+            immediately.
         """
-        # Fill super class columns, Mapper-columns - self.columns
-        mapper: sqlalchemy.orm.Mapper = sqlalchemy.inspection.inspect(type(self))
-
-        # Create a new instance of the DAO class
-        self.get_columns_from(obj=obj, columns=mapper.columns)
-        self.get_relationships_from(obj=obj, relationships=mapper.relationships, memo=memo, keep_alive=keep_alive)
+        plan = self.conversion_plan()
+        plan.copy_data_columns(self, obj)
+        self.fill_relationships(obj, plan.relationships, memo, keep_alive, worklist)
 
     def to_dao_if_subclass_of_alternative_mapping(self, obj: T, memo: Dict[int, Any], keep_alive: Dict[int, Any],
-                                                  base: Type[DataAccessObject]):
+                                                  base: Type[DataAccessObject], worklist: List = None):
         """
         Transforms the given object into a corresponding Data Access Object (DAO) if it is a
         subclass of an alternatively mapped entity. This involves processing both the inherited
@@ -206,47 +554,53 @@ class DataAccessObject(HasGeneric[T]):
         :param keep_alive: A dictionary to ensure that objects remain in memory during the transformation
                           process, preventing them from being garbage collected prematurely.
         :param base: The parent class type that defines the base mapping for the DAO.
+        :param worklist: The worklist the relationships are appended to. If None, the relationships are filled
+            immediately.
         :return: None. The method directly modifies the DAO instance by populating it with attribute
                  and relationship data from the source object.
         """
 
         # Temporarily remove the object from the memo dictionary to allow the parent DAO to be created
-        temp_dao = None
-        if id(obj) in memo:
-            temp_dao = memo[id(obj)]
-            del memo[id(obj)]
+        obj_id = id(obj)
+        temp_dao = memo.pop(obj_id, None)
 
         # create dao of alternatively mapped superclass
         parent_dao = base.original_class().to_dao(obj, memo=memo, keep_alive=keep_alive)
 
         # Restore the object in the memo dictionary
         if temp_dao is not None:
-            memo[id(obj)] = temp_dao
+            memo[obj_id] = temp_dao
 
-        # Fill super class columns
-        parent_mapper = sqlalchemy.inspection.inspect(base)
-        mapper: sqlalchemy.orm.Mapper = sqlalchemy.inspection.inspect(type(self))
-
-        # split up the columns in columns defined by the parent and columns defined by this dao
-        all_columns = mapper.columns
-        columns_of_parent = parent_mapper.columns
-        columns_of_this_table = [c for c in all_columns if c.name not in columns_of_parent]
+        parent_plan = base.conversion_plan()
+        subclass_plan = self.subclass_conversion_plan(base)
 
         # copy values from superclass dao
-        self.get_columns_from(parent_dao, columns_of_parent)
+        parent_plan.copy_data_columns(self, parent_dao)
 
         # copy values that only occur in this dao
-        self.get_columns_from(obj, columns_of_this_table)
+        subclass_plan.copy_own_data_columns(self, obj)
 
-        # split relationships in relationships by parent and relationships by child
-        all_relationships = mapper.relationships
-        relationships_of_parent = parent_mapper.relationships
-        relationships_of_this_table = [r for r in all_relationships if r not in relationships_of_parent]
+        self.fill_relationships(parent_dao, parent_plan.relationships, memo, keep_alive, worklist)
+        self.fill_relationships(obj, subclass_plan.own_relationships, memo, keep_alive, worklist)
 
-        for relationship in relationships_of_parent:
-            setattr(self, relationship.key, getattr(parent_dao, relationship.key))
+    def fill_relationships(self, obj: T, relationships: Iterable[Tuple[RelationshipProperty, bool]],
+                           memo: Dict[int, Any], keep_alive: Dict[int, Any], worklist: Optional[List]):
+        """
+        Fill the relationships of this DAO from an object or defer it to the worklist if one is given.
 
-        self.get_relationships_from(obj, relationships_of_this_table, memo, keep_alive)
+        :param obj: The source object containing the relationships.
+        :param relationships: The relationships to fill, see `ConversionPlan.relationships`.
+        :param memo: A dictionary to handle cyclic references by tracking processed objects.
+        :param keep_alive: A dictionary to ensure that objects remain in memory during the transformation.
+        :param worklist: The worklist the relationships are appended to. If None, the relationships are filled
+            immediately.
+        """
+        if not relationships:
+            return
+        if worklist is None:
+            self._get_relationships_from(obj, relationships, memo, keep_alive)
+        else:
+            worklist.append((self, obj, relationships))
 
     def get_columns_from(self, obj: T, columns: List):
         """
@@ -284,136 +638,203 @@ class DataAccessObject(HasGeneric[T]):
             transformation process, preventing them from being garbage collected prematurely.
         :return: None
         """
-        for relationship in relationships:
+        relationships = [(relationship, is_single_valued(relationship)) for relationship in relationships
+                         if relationship.direction in (MANYTOONE, ONETOMANY)]
+        self._get_relationships_from(obj, relationships, memo, keep_alive)
+
+    def _get_relationships_from(self, obj: T, relationships: Iterable[Tuple[RelationshipProperty, bool]],
+                                memo: Dict[int, Any], keep_alive: Dict[int, Any], worklist: List = None):
+        """
+        Retrieve and update relationships from an object, see `get_relationships_from`.
+
+        :param obj: The source object containing relationships to be processed.
+        :param relationships: The relationships to be accessed from the source object paired with
+            a flag that is True if the relationship refers to a single object, see `ConversionPlan.relationships`.
+        :param memo: A dictionary used to maintain references to already-processed objects
+            to avoid duplications or cycles during DAO construction.
+        :param keep_alive: A dictionary to ensure that objects remain in memory during the
+            transformation process, preventing them from being garbage collected prematurely.
+        :param worklist: The worklist of the conversion this call is a part of. If given, the referenced
+            objects are created by `create_dao` and their relationships are appended to the worklist.
+            Otherwise, the referenced objects are fully converted by `to_dao`.
+        :return: None
+        """
+        for relationship, single in relationships:
 
             # update one to one like relationships
-            if (relationship.direction == MANYTOONE or (
-                    relationship.direction == ONETOMANY and not relationship.uselist)):
+            if single:
 
                 value_in_obj = getattr(obj, relationship.key)
                 if value_in_obj is None:
                     dao_of_value = None
                 else:
-                    dao_class = get_dao_class(type(value_in_obj))
-                    if dao_class is None:
-                        raise NoDAOFoundDuringParsingError(value_in_obj, type(self), relationship)
-                    dao_of_value = dao_class.to_dao(value_in_obj, memo=memo, keep_alive=keep_alive)
+                    dao_class = self.dao_class_of_relationship_value(value_in_obj, relationship)
+                    dao_of_value = dao_class.convert_related(value_in_obj, memo, keep_alive, worklist)
 
                 setattr(self, relationship.key, dao_of_value)
 
             # update one to many relationships (list of other objects)
-            elif relationship.direction == ONETOMANY:
+            else:
                 result = []
                 value_in_obj = getattr(obj, relationship.key)
+
+                # collections are mostly homogeneous, hence the DAO class is only looked up when the type changes
+                type_of_value = None
+                dao_class = None
                 for v in value_in_obj:
-                    result.append(get_dao_class(type(v)).to_dao(v, memo=memo, keep_alive=keep_alive))
+                    if type(v) is not type_of_value:
+                        type_of_value = type(v)
+                        dao_class = self.dao_class_of_relationship_value(v, relationship)
+                    result.append(dao_class.convert_related(v, memo, keep_alive, worklist))
 
                 setattr(self, relationship.key, result)
 
+    @classmethod
+    def convert_related(cls, obj: Any, memo: Dict[int, Any], keep_alive: Dict[int, Any],
+                        worklist: Optional[List]) -> _DAO:
+        """
+        Convert an object that is referenced by a relationship.
+
+        :param obj: The referenced object.
+        :param memo: A dictionary to handle cyclic references by tracking processed objects.
+        :param keep_alive: A dictionary to ensure that objects remain in memory during the transformation.
+        :param worklist: The worklist of the ongoing conversion, if any.
+        :return: The DAO of the object.
+        """
+        if worklist is None:
+            return cls.to_dao(obj, memo=memo, keep_alive=keep_alive)
+        return cls.create_dao(obj, memo=memo, keep_alive=keep_alive, worklist=worklist)
+
+    @classmethod
+    def dao_class_of_relationship_value(cls, value: Any,
+                                        relationship: RelationshipProperty) -> Type[DataAccessObject]:
+        """
+        Look up the DAO class of an object that is referenced by a relationship of this DAO class.
+
+        :param value: The referenced object.
+        :param relationship: The relationship that references the object.
+        :return: The DAO class of the value.
+        :raises NoDAOFoundDuringParsingError: If there is no DAO class for the type of the value.
+        """
+        dao_class = get_dao_class(type(value))
+        if dao_class is None:
+            raise NoDAOFoundDuringParsingError(value, cls, relationship)
+        return dao_class
+
     def from_dao(self, memo: Dict[int, Any] = None, in_progress: Dict[int, bool] = None) -> T:
         """
         Converts the current Data Access Object (DAO) into its corresponding domain model
         representation. This method ensures that all scalar attributes and relationships
         defined for the DAO are properly mapped to the original domain model.
 
+        The DAO graph is converted iteratively. The conversion of every DAO is a generator, see `from_dao_steps`,
+        that yields the DAOs it needs to be converted first. The generators are kept on an explicit stack, such that
+        deep DAO graphs do not exhaust the call stack.
+
         :param memo: A dictionary used to maintain references to already-processed objects
                      to avoid duplications or cycles during DAO construction.
-        :param in_progress: A dictionary used to track objects that are currently being processed
-                            to detect circular dependencies.
+        :param in_progress: Unused and kept for backwards compatibility. Objects that are currently being
+                            processed are already in the memo, which is what resolves circular dependencies.
         :return: The corresponding domain model representing the current Data Access Object
         """
-        # Initialize dictionaries if they're None
+        # Initialize the memo if it is None
         if memo is None:
             memo = {}
-        if in_progress is None:
-            in_progress = {}
 
+        stack = [self.from_dao_steps(memo)]
+        result = None
+        while stack:
+            try:
+                dao = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                continue
+
+            # already converted or currently being converted DAOs are taken from the memo
+            result = memo.get(id(dao))
+            if result is None:
+                stack.append(dao.from_dao_steps(memo))
+
+        return result
+
+    def from_dao_steps(self, memo: Dict[int, Any]) -> Generator[DataAccessObject, Any, T]:
+        """
+        Converts the current DAO into its corresponding domain model representation, see `from_dao`.
+        Every DAO that has to be converted before this one is yielded and the result of its conversion has to be
+        sent back.
+
+        :param memo: A dictionary used to maintain references to already-processed objects
+                     to avoid duplications or cycles during DAO construction.
+        :return: The corresponding domain model representing the current Data Access Object
+        """
         # Return early if already fully constructed
-        if id(self) in memo:
-            return memo[id(self)]
+        self_id = id(self)
+        if self_id in memo:
+            return memo[self_id]
 
         # Phase 1: Allocate uninitialized object and memoize it immediately
         result = self.original_class().__new__(self.original_class())
-        memo[id(self)] = result
-        in_progress[id(self)] = True
-
-        mapper: sqlalchemy.orm.Mapper = sqlalchemy.inspection.inspect(type(self))
+        memo[self_id] = result
 
-        # get argument names of the original class
-        kwargs = {}
-        init_of_original_class = self.original_class().__init__
-        argument_names = [p.name for p in inspect.signature(init_of_original_class).parameters.values()][1:]
+        plan = self.conversion_plan()
 
-        # get data columns
-        for column in mapper.columns:
-            if column.name not in argument_names:
-                continue
-
-            if is_data_column(column):
-                kwargs[column.name] = getattr(self, column.name)
+        # get data columns that are arguments of the original class
+        kwargs = dict(zip(plan.argument_data_columns, plan.get_argument_data_columns(self)))
 
         # get relationships
         circular_refs = {}  # Store circular references to fix later
-        for relationship in mapper.relationships:
-            if relationship.key not in argument_names:
+        circular_ref_collections = {}  # Store circular references in collections to fix later
+        for relationship, single in plan.relationships:
+            if relationship.key not in plan.argument_names:
                 continue
 
             value = getattr(self, relationship.key)
 
             # handle one-to-one relationships
-            if (relationship.direction == MANYTOONE or (
-                    relationship.direction == ONETOMANY and not relationship.uselist)):
+            if single:
                 if value is None:
                     parsed = None
                 else:
-                    parsed = value.from_dao(memo=memo, in_progress=in_progress)
+                    parsed = yield value
                     if parsed is memo.get(id(value)):
                         circular_refs[relationship.key] = value
                 kwargs[relationship.key] = parsed
 
             # handle one-to-many relationships
-            elif relationship.direction == ONETOMANY:
+            else:
                 if value:
                     og_instances = []
                     for v in value:
-                        instance = v.from_dao(memo=memo, in_progress=in_progress)
+                        instance = yield v
                         if instance is memo.get(id(v)):
-                            circular_refs.setdefault(relationship.key, []).append(v)
+                            circular_ref_collections.setdefault(relationship.key, []).append(v)
                         og_instances.append(instance)
                     kwargs[relationship.key] = type(value)(og_instances)
                 else:
                     kwargs[relationship.key] = value
-            else:
-                raise NotImplementedError(f"Cannot parse relationship {relationship}")
 
         # if i am the child of an alternatively mapped parent
-        base = self.__class__.__bases__[0]
+        base = plan.alternatively_mapped_base
         base_kwargs = {}
-        if issubclass(base, DataAccessObject) and issubclass(base.original_class(), AlternativeMapping):
+        if base is not None:
 
             # construct the super class from the super dao
             parent_dao = base()  # empty parent DAO
-            parent_mapper = sqlalchemy.inspection.inspect(base)
-
-            # copy scalar columns that the parent DAO is aware of
-            for column in parent_mapper.columns:
-                if is_data_column(column):
-                    setattr(parent_dao, column.name, getattr(self, column.name))
+            parent_plan = base.conversion_plan()
 
-            # copy relationships that the parent DAO is aware of
-            for rel in parent_mapper.relationships:
-                setattr(parent_dao, rel.key, getattr(self, rel.key))
+            # copy scalar columns and relationships that the parent DAO is aware of
+            parent_plan.copy_attributes(parent_dao, self)
 
             # now safely reconstruct the parent domain object
-            base_result = parent_dao.from_dao(memo=memo, in_progress=in_progress)
+            base_result = yield parent_dao
 
             # fill the gaps from the base result into kwargs for __init__
-            for argument in argument_names:
-                if argument not in kwargs:
-                    try:
-                        base_kwargs[argument] = getattr(base_result, argument)
-                    except AttributeError:
-                        ...
+            for argument in plan.unmapped_argument_names:
+                try:
+                    base_kwargs[argument] = getattr(base_result, argument)
+                except AttributeError:
+                    ...
 
         # Call the original __init__ to ensure proper initialization (e.g., default_factory fields)
         try:
@@ -426,60 +847,55 @@ class DataAccessObject(HasGeneric[T]):
 
         # Fix circular references
         for key, value in circular_refs.items():
-            if isinstance(value, list):
-                fixed_list = []
-                for v in value:
-                    fixed = memo.get(id(v))
-                    fixed_list.append(fixed)
-                setattr(result, key, fixed_list)
-            else:
-                fixed = memo.get(id(value))
-                setattr(result, key, fixed)
+            setattr(result, key, memo.get(id(value)))
+
+        for key, values in circular_ref_collections.items():
+            setattr(result, key, [memo.get(id(v)) for v in values])
 
         # If the result is an AlternativeMapping, we need to create the original object
         if isinstance(result, AlternativeMapping):
             # If the result has a create_from_dao method, call it to finalize the object creation
             result = result.create_from_dao()
-            memo[id(self)] = result  # Update the memo with the final object
-
-        # Done processing this object
-        del in_progress[id(self)]
+            memo[self_id] = result  # Update the memo with the final object
 
         return result
 
     def __repr__(self):
-        if not hasattr(_repr_thread_local, 'seen'):
-            _repr_thread_local.seen = set()
+        plan = self.conversion_plan()
 
-        if id(self) in _repr_thread_local.seen:
+        # without relationships the representation cannot recurse
+        if not plan.relationships:
+            return f"{self.__class__.__name__}({', '.join(plan.repr_data_columns(self))})"
+
+        seen = _repr_thread_local.seen
+        self_id = id(self)
+        if self_id in seen:
             return f"{self.__class__.__name__}(...)"
 
-        _repr_thread_local.seen.add(id(self))
+        seen.add(self_id)
         try:
-            mapper: sqlalchemy.orm.Mapper = sqlalchemy.inspection.inspect(type(self))
-            kwargs = []
-            for column in mapper.columns:
-                value = getattr(self, column.name)
-                if is_data_column(column):
-                    kwargs.append(f"{column.name}={repr(value)}")
-
-            for relationship in mapper.relationships:
+            kwargs = plan.repr_data_columns(self)
+
+            for relationship, single in plan.relationships:
                 value = getattr(self, relationship.key)
-                if value is not None:
-                    if isinstance(value, list):
-                        kwargs.append(f"{relationship.key}=[{', '.join(repr(v) for v in value)}]")
-                    else:
-                        kwargs.append(f"{relationship.key}={repr(value)}")
-                else:
+                if value is None:
                     kwargs.append(f"{relationship.key}=None")
+                elif single:
+                    kwargs.append(f"{relationship.key}={repr(value)}")
+                else:
+                    kwargs.append(f"{relationship.key}=[{', '.join(repr(v) for v in value)}]")
 
             return f"{self.__class__.__name__}({', '.join(kwargs)})"
         finally:
-            _repr_thread_local.seen.remove(id(self))
+            seen.remove(self_id)
 
 
 class AlternativeMapping(HasGeneric[T]):
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_original_class(_alternative_mappings, cls)
+
     @classmethod
     def to_dao(cls, obj: T, memo: Dict[int, Any] = None, keep_alive: Dict[int, Any] = None) -> _DAO:
         """
@@ -525,22 +941,15 @@ class AlternativeMapping(HasGeneric[T]):
         raise NotImplementedError
 
 
-@lru_cache(maxsize=None)
 def get_dao_class(cls: Type) -> Optional[Type[DataAccessObject]]:
-    if get_alternative_mapping(cls) is not None:
-        cls = get_alternative_mapping(cls)
-    for dao in recursive_subclasses(DataAccessObject):
-        if dao.original_class() == cls:
-            return dao
-    return None
+    alternative_mapping = _alternative_mappings.get(cls)
+    if alternative_mapping is not None:
+        cls = alternative_mapping
+    return _dao_classes.get(cls)
 
 
-@lru_cache(maxsize=None)
 def get_alternative_mapping(cls: Type) -> Optional[Type[DataAccessObject]]:
-    for alt_mapping in recursive_subclasses(AlternativeMapping):
-        if alt_mapping.original_class() == cls:
-            return alt_mapping
-    return None
+    return _alternative_mappings.get(cls)
 
 
 def to_dao(obj: Any, memo: Dict[int, Any] = None, keep_alive: Dict[int, Any] = None) -> DataAccessObject:
@@ -555,3 +964,46 @@ def to_dao(obj: Any, memo: Dict[int, Any] = None, keep_alive: Dict[int, Any] = N
     if dao_class is None:
         raise NoDAOFoundError(type(obj))
     return dao_class.to_dao(obj, memo, keep_alive)
+
+
+def to_dao_bulk(objs: Iterable[Any], memo: Dict[int, Any] = None,
+                keep_alive: Dict[int, Any] = None) -> List[DataAccessObject]:
+    """
+    Convert many objects to dao classes at once.
+    The objects are grouped by their DAO class, which is resolved once per type, and every group is converted by
+    `DataAccessObject.to_dao_bulk`. All objects share the memo, such that objects that are referenced by several of
+    them are converted only once.
+
+    :param objs: The objects to convert to daos.
+    :param memo: A dictionary to keep track of already converted objects.
+    :param keep_alive: A dictionary to keep the objects alive during the conversion.
+    :return: The daos in the order of the objects.
+    """
+    if memo is None:
+        memo = {}
+
+    if keep_alive is None:
+        keep_alive = {}
+
+    objs = list(objs)
+
+    # group the objects by their DAO class, which is resolved once per type
+    dao_classes = {}
+    indices_of_dao_class = {}
+    for index, obj in enumerate(objs):
+        obj_type = type(obj)
+        dao_class = dao_classes.get(obj_type)
+        if dao_class is None:
+            dao_class = get_dao_class(obj_type)
+            if dao_class is None:
+                raise NoDAOFoundError(obj_type)
+            dao_classes[obj_type] = dao_class
+        indices_of_dao_class.setdefault(dao_class, []).append(index)
+
+    result = [None] * len(objs)
+    for dao_class, indices in indices_of_dao_class.items():
+        daos = dao_class.to_dao_bulk([objs[index] for index in indices], memo=memo, keep_alive=keep_alive)
+        for index, dao in zip(indices, daos):
+            result[index] = dao
+
+    return result
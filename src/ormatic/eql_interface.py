@@ -1,13 +1,14 @@
 # python
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Any, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Any, Optional, Dict, Type, Tuple, Callable
 import operator
 
 import sqlalchemy.inspection
 from sqlalchemy import and_, or_, select, Select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, RelationshipProperty
 
 from entity_query_language.symbolic import (
     SymbolicExpression,
@@ -18,13 +19,107 @@ from entity_query_language.symbolic import (
     An, The, HasDomain
 )
 
-from .dao import get_dao_class
+from .dao import get_dao_class, DataAccessObject
 
 
 class EQLTranslationError(Exception):
     """Raised when an EQL expression cannot be translated into SQLAlchemy."""
 
 
+@lru_cache(maxsize=None)
+def relationships_of(dao_class: Type[DataAccessObject]) -> Dict[str, RelationshipProperty]:
+    """
+    Get the relationships of a DAO class by their key. The mapper is inspected once per DAO class.
+
+    :param dao_class: The DAO class to get the relationships of.
+    :return: A dictionary mapping the keys of the relationships to the relationships.
+    """
+    return {relationship.key: relationship for relationship in sqlalchemy.inspection.inspect(dao_class).relationships}
+
+
+comparison_builders: Dict[str, Callable[[Any, Any], Any]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'lt': operator.lt,
+    'ge': operator.ge,
+    'le': operator.le,
+    # contains(a, b) means b in a, hence the right side is the column and the left side the iterable
+    'contains': lambda left, right: right.in_(left),
+    'not_contains': lambda left, right: right.not_in(left),
+}
+"""
+The builders of the SQLAlchemy expressions of comparators, by the name of the operation of the comparator.
+"""
+
+
+def leaf_variable_and_dao(attribute: Attribute) -> Tuple[Any, Optional[Type[DataAccessObject]]]:
+    """
+    Walk an attribute chain down to the variable it is accessed on.
+
+    :param attribute: The outermost attribute of the chain.
+    :return: The leaf variable of the chain and the DAO class of its type, which is None if there is none.
+    """
+    node = attribute
+    while isinstance(node, Attribute):
+        node = node._child_
+    return node, get_dao_class(node._type_)
+
+
+@lru_cache(maxsize=None)
+def relationship_and_foreign_key(dao_class: Type[DataAccessObject],
+                                 name: str) -> Tuple[Optional[RelationshipProperty], Any]:
+    """
+    Get a relationship of a DAO class and the column of its local foreign key.
+    The result is computed once per DAO class and key.
+
+    :param dao_class: The DAO class that has the relationship.
+    :param name: The key of the relationship.
+    :return: The relationship and the column of its first local foreign key (assumes single-column FKs) or
+        (None, None) if the DAO class has no relationship with that key.
+    """
+    relationship = relationships_of(dao_class).get(name)
+    if relationship is None:
+        return None, None
+    column = next(iter(relationship.local_columns))
+    return relationship, getattr(dao_class, column.key)
+
+
+def literal_key(entity: Any) -> Optional[Tuple[Type[DataAccessObject], Any]]:
+    """
+    Get the key of an entity literal by which the id of its DAO is prefetched, see
+    `EQLTranslator._prefetch_literal_ids`.
+
+    :param entity: The value of the literal.
+    :return: The DAO class of the entity and its name, or None if the entity cannot be looked up by a hashable name.
+    """
+    dao_class = get_dao_class(type(entity))
+    if dao_class is None or not hasattr(dao_class, 'name'):
+        return None
+    name = getattr(entity, 'name', None)
+    if name is None:
+        return None
+    try:
+        hash(name)
+    except TypeError:
+        return None
+    return dao_class, name
+
+
+def operands_of(query: SymbolicExpression) -> Tuple[SymbolicExpression, ...]:
+    """
+    Get the operands of a logical EQL query.
+    Supports binary nodes (left/right) introduced in newer EQL and a list of children for older EQL.
+
+    :param query: The logical EQL query.
+    :return: The operands of the query.
+    """
+    if hasattr(query, 'left') and hasattr(query, 'right'):
+        return query.left, query.right
+    # Backward compatibility: list of children
+    return tuple(getattr(query, '_children_', None) or ())
+
+
 @dataclass
 class EQLTranslator:
     """
@@ -44,10 +139,16 @@ class EQLTranslator:
     session: Session
 
     sql_query: Optional[Select] = None
+    # The DAO class of the selected variable
+    _anchor_dao: Optional[type] = None
     # Tracks joins introduced while traversing attribute chains (by path)
-    _joined_daos: set[Any] = None
+    _joined_daos: set[Any] = field(default_factory=set)
     # Tracks joins of whole DAO classes introduced due to variable equality joins
-    _joined_tables: set[type] = None
+    _joined_tables: set[type] = field(default_factory=set)
+    # Caches the columns of attribute chains that were already resolved, by base DAO and chain of names
+    _resolved_attributes: dict[tuple[type, tuple[str, ...]], Any] = field(default_factory=dict)
+    # Caches the ids of the DAOs of entity literals, by DAO class and name of the entity, None if there is no such DAO
+    _literal_ids: dict[tuple[type, Any], Any] = field(default_factory=dict)
 
     @property
     def quantifier(self):
@@ -63,11 +164,16 @@ class EQLTranslator:
 
     def translate(self) -> List[Any]:
         dao_class = get_dao_class(self.select_like.selected_variable_._type_)
+        self._anchor_dao = dao_class
         self.sql_query = select(dao_class)
         # initialize join caches
         self._joined_daos = set()
         self._joined_tables = set()
-        conditions = self.translate_query(self.root_condition)
+        self._resolved_attributes = {}
+        self._literal_ids = {}
+        root_condition = self.root_condition
+        self._prefetch_literal_ids(root_condition)
+        conditions = self.translate_query(root_condition)
         if conditions is not None:
             self.sql_query = self.sql_query.where(conditions)
 
@@ -92,16 +198,21 @@ class EQLTranslator:
     # --------------------------
 
     def translate_query(self, query: SymbolicExpression):
-        if isinstance(query, AND):
-            return self.translate_and(query)
-        elif isinstance(query, OR):
-            return self.translate_or(query)
-        elif isinstance(query, Comparator):
-            return self.translate_comparator(query)
-        elif isinstance(query, Attribute):
-            return self.translate_attribute(query)
-        else:
-            raise EQLTranslationError(f"Unknown query type: {type(query)}")
+        return self.translator_of(type(query))(self, query)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def translator_of(cls, query_type: type) -> Callable[[EQLTranslator, SymbolicExpression], Any]:
+        """
+        Get the method that translates EQL queries of a type. The method is resolved once per type.
+        :param query_type: The type of the EQL query
+        :return: The unbound translate method for queries of that type.
+        """
+        for base, translator in ((AND, cls.translate_and), (OR, cls.translate_or),
+                                 (Comparator, cls.translate_comparator), (Attribute, cls.translate_attribute)):
+            if issubclass(query_type, base):
+                return translator
+        raise EQLTranslationError(f"Unknown query type: {query_type}")
 
     def translate_and(self, query: AND):
         """
@@ -110,22 +221,7 @@ class EQLTranslator:
         :param query: EQL query
         :return: SQL expression or None if all parts are handled via JOINs.
         """
-        parts = []
-        # New API: binary tree with left/right
-        if hasattr(query, 'left') and hasattr(query, 'right'):
-            left_part = self.translate_query(query.left)
-            right_part = self.translate_query(query.right)
-            if left_part is not None:
-                parts.append(left_part)
-            if right_part is not None:
-                parts.append(right_part)
-        else:
-            # Backward compatibility: list of children
-            children = getattr(query, '_children_', None) or []
-            for c in children:
-                p = self.translate_query(c)
-                if p is not None:
-                    parts.append(p)
+        parts = self.translate_children(query)
         if not parts:
             return None
         if len(parts) == 1:
@@ -139,26 +235,35 @@ class EQLTranslator:
         :param query: EQL query
         :return: SQL expression or None if all parts are handled via JOINs.
         """
-        parts = []
-        if hasattr(query, 'left') and hasattr(query, 'right'):
-            left_part = self.translate_query(query.left)
-            right_part = self.translate_query(query.right)
-            if left_part is not None:
-                parts.append(left_part)
-            if right_part is not None:
-                parts.append(right_part)
-        else:
-            children = getattr(query, '_children_', None) or []
-            for c in children:
-                p = self.translate_query(c)
-                if p is not None:
-                    parts.append(p)
+        parts = self.translate_children(query)
         if not parts:
             return None
         if len(parts) == 1:
             return parts[0]
         return or_(*parts)
 
+    def translate_children(self, query: SymbolicExpression) -> List[Any]:
+        """
+        Translate the operands of a logical EQL query in a single pass.
+        Nested queries of the same type as the query are flattened into its operands, such that a chain of
+        binary nodes becomes one n-ary SQL expression. The chain is walked with an explicit stack.
+        :param query: EQL query
+        :return: The SQL expressions of the operands that are not handled via JOINs.
+        """
+        query_type = type(query)
+        parts = []
+        stack = [query]
+        while stack:
+            node = stack.pop()
+            if type(node) is not query_type:
+                part = self.translate_query(node)
+                if part is not None:
+                    parts.append(part)
+                continue
+            # push in reverse such that the operands are translated from left to right
+            stack.extend(reversed(operands_of(node)))
+        return parts
+
     def translate_comparator(self, query: Comparator):
         """
         Translate an eql.Comparator query into a SQLAlchemy binary expression, or perform JOINs for
@@ -169,56 +274,23 @@ class EQLTranslator:
         if (getattr(query.operation, '__name__', None) == 'eq' or query.operation is operator.eq) \
                 and isinstance(query.left, Attribute) and isinstance(query.right, Attribute):
             # Extract leaf variables and base DAOs
-            def leaf_variable(attr: Attribute):
-                node = attr
-                while isinstance(node, Attribute):
-                    node = node._child_
-                return node
-
-            def base_dao_of(attr: Attribute):
-                leaf = leaf_variable(attr)
-                return get_dao_class(leaf._type_)
-
-            def last_attr_name(attr: Attribute):
-                node = attr
-                while isinstance(node, Attribute) and isinstance(node._child_, Attribute):
-                    node = node._child_
-                return attr._attr_name_ if not isinstance(attr._child_, Attribute) else node._attr_name_
-
-            left_leaf = leaf_variable(query.left)
-            right_leaf = leaf_variable(query.right)
-            left_dao = base_dao_of(query.left)
-            right_dao = base_dao_of(query.right)
+            left_leaf, left_dao = leaf_variable_and_dao(query.left)
+            right_leaf, right_dao = leaf_variable_and_dao(query.right)
 
             # Only apply if leaves (variables) differ
             if left_leaf is not right_leaf and left_dao is not None and right_dao is not None:
                 # Determine if last attribute on both sides are relationships and obtain their local FK columns
-                def rel_and_fk(dao_cls, attr_name):
-                    mapper = sqlalchemy.inspection.inspect(dao_cls)
-                    rel = mapper.relationships.get(attr_name) if hasattr(mapper.relationships, 'get') else None
-                    if rel is None:
-                        for r in mapper.relationships:
-                            if r.key == attr_name:
-                                rel = r
-                                break
-                    if rel is None:
-                        return None, None
-                    # choose first local column key (assumes single-column FK)
-                    col = next(iter(rel.local_columns))
-                    fk_col = getattr(dao_cls, col.key)
-                    return rel, fk_col
-
                 # Find the immediate attribute names accessed on each variable
                 # For simple variable.attr expressions, that's query.left._attr_name_ and query.right._attr_name_
                 left_attr_name = query.left._attr_name_
                 right_attr_name = query.right._attr_name_
 
-                left_rel, left_fk = rel_and_fk(left_dao, left_attr_name)
-                right_rel, right_fk = rel_and_fk(right_dao, right_attr_name)
+                left_rel, left_fk = relationship_and_foreign_key(left_dao, left_attr_name)
+                right_rel, right_fk = relationship_and_foreign_key(right_dao, right_attr_name)
 
                 if left_rel is not None and right_rel is not None:
                     # Build JOIN to the non-anchor DAO with ON clause being the equality condition
-                    anchor_dao = get_dao_class(self.select_like.selected_variable_._type_)
+                    anchor_dao = self._anchor_dao
                     if anchor_dao is None:
                         raise EQLTranslationError("Selected variable has no DAO class")
 
@@ -228,9 +300,6 @@ class EQLTranslator:
                     else:
                         target_dao, target_fk, anchor_fk = left_dao, left_fk, right_fk
 
-                    if self._joined_tables is None:
-                        self._joined_tables = set()
-
                     if target_dao not in self._joined_tables:
                         onclause = (target_fk == anchor_fk)
                         self.sql_query = self.sql_query.join(target_dao, onclause=onclause)
@@ -252,41 +321,59 @@ class EQLTranslator:
         left = to_sql_side(query.left)
         right = to_sql_side(query.right)
 
-        op = query.operation
         # Map callable operations to SQLAlchemy expressions
-        if op is operator.eq or getattr(op, '__name__', None) == 'eq':
-            return left == right
-        if op is operator.gt or getattr(op, '__name__', None) == 'gt':
-            return left > right
-        if op is operator.lt or getattr(op, '__name__', None) == 'lt':
-            return left < right
-        if op is operator.ge or getattr(op, '__name__', None) == 'ge':
-            return left >= right
-        if op is operator.le or getattr(op, '__name__', None) == 'le':
-            return left <= right
-        if op is operator.ne or getattr(op, '__name__', None) == 'ne':
-            return left != right
-        # contains(a, b) means b in a
-        name = getattr(op, '__name__', '')
-        if op is operator.contains or name in ('contains', 'not_contains'):
-            # Orientation: right should be column/attribute, left should be iterable
-            expr = right.in_(left)
-            if name == 'not_contains':
-                # SQLAlchemy not in
-                try:
-                    return right.notin_(left)
-                except AttributeError:
-                    from sqlalchemy import not_ as sa_not
-                    return sa_not(expr)
-            return expr
-        raise EQLTranslationError(f"Unknown operator: {query.operation}")
+        builder = comparison_builders.get(getattr(query.operation, '__name__', None))
+        if builder is None:
+            raise EQLTranslationError(f"Unknown operator: {query.operation}")
+        return builder(left, right)
 
-    def _literal_from_variable_domain(self, var_like: HasDomain) -> Any:
+    def _prefetch_literal_ids(self, condition: SymbolicExpression):
+        """
+        Collect the entity literals of all comparators in a condition and resolve the ids of their DAOs with one
+        query per DAO class, instead of one query per literal.
+
+        :param condition: The condition to collect the entity literals from.
+        """
+        names_of_dao_class: Dict[type, set] = {}
+        stack = [condition]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (AND, OR)):
+                stack.extend(operands_of(node))
+                continue
+            if not isinstance(node, Comparator):
+                continue
+            for side in (node.left, node.right):
+                if isinstance(side, Attribute) or not isinstance(side, HasDomain):
+                    continue
+                key = literal_key(self._literal_of(side))
+                if key is not None:
+                    names_of_dao_class.setdefault(key[0], set()).add(key[1])
+
+        for dao_class, names in names_of_dao_class.items():
+            rows = self.session.execute(select(dao_class.id, dao_class.name).where(dao_class.name.in_(names)))
+            for id_, name in rows:
+                # keep the first match, like the query of a single literal does
+                self._literal_ids.setdefault((dao_class, name), id_)
+            # remember the misses, such that they are not queried again one by one
+            for name in names:
+                self._literal_ids.setdefault((dao_class, name), None)
+
+    @staticmethod
+    def _literal_of(var_like: HasDomain) -> Any:
         # EQL Variables/literals expose a domain where the value can be taken from.
-        entity = next(iter(var_like._domain_)).value
-        
+        return next(iter(var_like._domain_)).value
+
+    def _literal_from_variable_domain(self, var_like: HasDomain) -> Any:
+        entity = self._literal_of(var_like)
+
+        # Entities that were resolved up front by _prefetch_literal_ids
+        key = literal_key(entity)
+        if key is not None and key in self._literal_ids:
+            id_ = self._literal_ids[key]
+            return entity if id_ is None else id_
+
         # If it's an entity object, we need to find its DAO and get the ID
-        from .dao import get_dao_class
         dao_class = get_dao_class(type(entity))
         if dao_class is not None:
             # Find the DAO instance for this entity
@@ -294,10 +381,10 @@ class EQLTranslator:
             dao_instance = self.session.query(dao_class).filter_by(**self._get_entity_filter(entity)).first()
             if dao_instance is not None:
                 return dao_instance.id
-        
+
         # Fallback to the entity itself (for non-entity literals)
         return entity
-    
+
     def _get_entity_filter(self, entity) -> dict:
         """Get filter criteria to find the DAO instance for an entity."""
         # This is a simple implementation that works for entities with a 'name' attribute
@@ -326,30 +413,33 @@ class EQLTranslator:
         if current_dao is None:
             raise EQLTranslationError(f"No DAO class found for {base_cls}.")
 
-        # Walk the chain from the base outward
-        names = list(reversed(names))
+        # Attribute chains that were resolved before have already introduced their JOINs
+        names = tuple(reversed(names))
+        key = (current_dao, names)
+        column = self._resolved_attributes.get(key)
+        if column is None:
+            column = self._resolve_attribute_chain(current_dao, names)
+            self._resolved_attributes[key] = column
+        return column
+
+    def _resolve_attribute_chain(self, current_dao: type, names: tuple[str, ...]):
+        """
+        Walk an attribute chain from its base DAO outward, applying JOINs for the relationships along the chain.
+
+        :param current_dao: The DAO class of the leaf variable of the chain.
+        :param names: The names of the attributes from the base outward.
+        :return: The SQLAlchemy column the chain ends on.
+        """
         for idx, name in enumerate(names):
-            mapper = sqlalchemy.inspection.inspect(current_dao)
-            # relationship keys
-            rel = mapper.relationships.get(name) if hasattr(mapper.relationships, 'get') else None
-            if rel is None:
-                # check by iterating if .get not available
-                for r in mapper.relationships:
-                    if r.key == name:
-                        rel = r
-                        break
+            rel, foreign_key = relationship_and_foreign_key(current_dao, name)
             if rel is not None:
                 # If this is the last element in the chain, return the FK column instead of joining
                 if idx == len(names) - 1:
                     # Return the foreign key column that backs this relationship
-                    # Get the first local column (assumes single-column FK)
-                    local_col = next(iter(rel.local_columns))
-                    return getattr(current_dao, local_col.key)
+                    return foreign_key
                 else:
                     # join using explicit relationship attribute to disambiguate path
                     path_key = (current_dao, name)
-                    if self._joined_daos is None:
-                        self._joined_daos = set()
                     if path_key not in self._joined_daos:
                         self.sql_query = self.sql_query.join(getattr(current_dao, name))
                         self._joined_daos.add(path_key)
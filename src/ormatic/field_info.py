@@ -64,7 +64,7 @@ class FieldInfo:
         self.clazz = clazz
 
         try:
-            type_hints = get_type_hints(clazz)[self.name]
+            type_hints = type_hints_of(clazz)[self.name]
         except NameError as e:
             found_clazz = manually_search_for_class_name(e.name)
             module = importlib.import_module(found_clazz.__module__)
@@ -114,6 +114,17 @@ class FieldInfo:
         return self.type == datetime
 
 
+@lru_cache(maxsize=None)
+def type_hints_of(clazz: Type) -> typing.Dict[str, typing.Any]:
+    """
+    Get the type hints of a class. The hints are resolved once per class and shared by all of its fields.
+
+    :param clazz: The class to get the type hints of
+    :return: The type hints of the class. The returned dictionary must not be modified.
+    """
+    return get_type_hints(clazz)
+
+
 def is_container(clazz: Type) -> bool:
     """
     Check if a class is an iterable.
@@ -276,13 +276,16 @@ class WrappedTable:
         if self.parent_table is not None:
             self.skip_fields += self.parent_table.skip_fields + self.parent_table.fields
 
-        result = [field for field in fields(self.clazz) if field not in self.skip_fields]
+        # dataclass fields are shared between a class and its subclasses, hence they can be compared by identity
+        skip_fields = set(self.skip_fields)
+        result = [field for field in fields(self.clazz) if field not in skip_fields]
 
         if self.parent_table is not None:
             if issubclass(self.parent_table.clazz, AlternativeMapping):
                 og_parent_class = self.parent_table.clazz.original_class()
-                fields_in_og_class_but_not_in_dao = [f for f in fields(og_parent_class)
-                                                     if f not in self.parent_table.fields]
+                fields_of_parent_table = set(self.parent_table.fields)
+                fields_in_og_class_but_not_in_dao = {f for f in fields(og_parent_class)
+                                                     if f not in fields_of_parent_table}
 
                 result = [r for r in result if r not in fields_in_og_class_but_not_in_dao]
 
@@ -373,6 +373,18 @@ class PrivateDefaultFactory:
     _private_list: List[int] = field(default_factory=list)
 
 
+# check that the own __init__ of a dataclass is used when loading it
+@dataclass
+class DataclassWithCustomInit:
+    x: int
+    doubled_x: int
+
+    def __init__(self, x: int):
+        self.x = x
+        self.doubled_x = 2 * x
+        self.initialized = True
+
+
 @dataclass
 class Body:
     name: str
@@ -406,4 +418,28 @@ class Fixed(Connection):
 class World:
     id_: int
     bodies: List[Body]
-    connections: List[Connection] = field(default_factory=list)
\ No newline at end of file
+    connections: List[Connection] = field(default_factory=list)
+
+@dataclass
+class PositionedEntity:
+    name: str
+    position: Position
+
+
+# check that subclasses of alternatively mapped classes get the relationships of the mapping
+@dataclass
+class PositionedEntityMapping(AlternativeMapping[PositionedEntity]):
+    label: str
+    position: Position
+
+    @classmethod
+    def create_instance(cls, obj: PositionedEntity):
+        return cls(obj.name, obj.position)
+
+    def create_from_dao(self) -> T:
+        return PositionedEntity(self.label, self.position)
+
+
+@dataclass
+class DerivedPositionedEntity(PositionedEntity):
+    description: str = "Default description"
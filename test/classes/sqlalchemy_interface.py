@@ -156,6 +156,36 @@ class CustomEntityDAO(Base, DataAccessObject[classes.example_classes.CustomEntit
         'polymorphic_identity': 'CustomEntityDAO',
     }
 
+class DataclassWithCustomInitDAO(Base, DataAccessObject[classes.example_classes.DataclassWithCustomInit]):
+    __tablename__ = 'DataclassWithCustomInitDAO'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    x: Mapped[int]
+    doubled_x: Mapped[int]
+
+
+
+
+
+class PositionedEntityMappingDAO(Base, DataAccessObject[classes.example_classes.PositionedEntityMapping]):
+    __tablename__ = 'PositionedEntityMappingDAO'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+    label: Mapped[str] = mapped_column(String(255), nullable=False)
+    polymorphic_type: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    position_id: Mapped[int] = mapped_column(ForeignKey('PositionDAO.id', use_alter=True), nullable=True)
+
+    position: Mapped[PositionDAO] = relationship('PositionDAO', uselist=False, foreign_keys=[position_id], post_update=True)
+
+    __mapper_args__ = {
+        'polymorphic_on': 'polymorphic_type',
+        'polymorphic_identity': 'PositionedEntityMappingDAO',
+    }
+
 class DoublePositionAggregatorDAO(Base, DataAccessObject[classes.example_classes.DoublePositionAggregator]):
     __tablename__ = 'DoublePositionAggregatorDAO'
 
@@ -547,6 +577,21 @@ class DerivedEntityDAO(CustomEntityDAO, DataAccessObject[classes.example_classes
         'inherit_condition': id == CustomEntityDAO.id,
     }
 
+class DerivedPositionedEntityDAO(PositionedEntityMappingDAO, DataAccessObject[classes.example_classes.DerivedPositionedEntity]):
+    __tablename__ = 'DerivedPositionedEntityDAO'
+
+    id: Mapped[int] = mapped_column(ForeignKey(PositionedEntityMappingDAO.id), primary_key=True)
+
+
+    description: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+
+    __mapper_args__ = {
+        'polymorphic_identity': 'DerivedPositionedEntityDAO',
+        'inherit_condition': id == PositionedEntityMappingDAO.id,
+    }
+
 class TorsoDAO(KinematicChainDAO, DataAccessObject[classes.example_classes.Torso]):
     __tablename__ = 'TorsoDAO'
 
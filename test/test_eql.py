@@ -1,5 +1,5 @@
 import unittest
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, event
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.orm import Session, configure_mappers, aliased
 
@@ -98,6 +98,40 @@ class EQLTestCase(unittest.TestCase):
         self.assertIsNotNone(result[0].position)
         self.assertEqual(result[0].position.z, 4)
 
+    def test_translate_repeated_attribute_chain(self):
+        self.session.add(PoseDAO(position=PositionDAO(x=1, y=2, z=3),
+                                 orientation=OrientationDAO(w=1.0, x=0.0, y=0.0, z=0.0)))
+        self.session.add(PoseDAO(position=PositionDAO(x=1, y=2, z=4),
+                                 orientation=OrientationDAO(w=1.0, x=0.0, y=0.0, z=0.0)))
+        self.session.commit()
+
+        query = an(entity(pose := let(type_=Pose, domain=[], name="pose"),
+                          and_(pose.position.z > 3, pose.position.z < 5)))
+        translator = eql_to_sql(query, self.session)
+        query_by_hand = select(PoseDAO).join(PositionDAO).where(PositionDAO.z > 3, PositionDAO.z < 5)
+
+        self.assertEqual(str(translator.sql_query), str(query_by_hand))
+
+        result = translator.evaluate()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].position.z, 4)
+
+    def test_translate_nested_and(self):
+        self.session.add(PositionDAO(x=1, y=2, z=3))
+        self.session.add(PositionDAO(x=2, y=3, z=4))
+        self.session.commit()
+
+        query = an(entity(position := let(type_=Position, domain=[], name="position"),
+                          and_(position.x > 1, position.y > 2, position.z > 3)))
+        translator = eql_to_sql(query, self.session)
+        query_by_hand = select(PositionDAO).where(PositionDAO.x > 1, PositionDAO.y > 2, PositionDAO.z > 3)
+
+        self.assertEqual(str(translator.sql_query), str(query_by_hand))
+
+        result = translator.evaluate()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].z, 4)
+
     def test_translate_in_operator(self):
         self.session.add(PositionDAO(x=1, y=2, z=3))
         self.session.add(PositionDAO(x=5, y=2, z=6))
@@ -133,8 +167,10 @@ class EQLTestCase(unittest.TestCase):
         with self.assertRaises(MultipleResultsFound):
             result = translator.evaluate()
 
-    def test_equal(self):
-        # Create the world with its bodies and connections
+    def create_world(self) -> World:
+        """
+        Create the world with its bodies and connections and store it in the database.
+        """
         world = World(1, [Body("Container1"), Body("Container2"), Body("Handle1"), Body("Handle2")])
         c1_c2 = Prismatic(world.bodies[0], world.bodies[1])
         c2_h2 = Fixed(world.bodies[1], world.bodies[3])
@@ -143,6 +179,28 @@ class EQLTestCase(unittest.TestCase):
         dao = to_dao(world)
         self.session.add(dao)
         self.session.commit()
+        return world
+
+    def count_selects(self, function):
+        """
+        Count the SELECT statements that are executed while calling a function.
+
+        :return: The result of the function and the number of SELECT statements.
+        """
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        try:
+            result = function()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", record)
+        return result, sum(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+    def test_equal(self):
+        world = self.create_world()
 
         # Query for the kinematic tree of the drawer which has more than one component.
         # Declare the placeholders
@@ -165,6 +223,31 @@ class EQLTestCase(unittest.TestCase):
         self.assertEqual(result[0].parent.name, "Container2")
         self.assertEqual(result[0].child.name, "Handle2")
 
+    def test_entity_literals(self):
+        world = self.create_world()
+
+        fixed_connection = let(type_=Fixed, domain=world.connections, name="fixed_connection")
+        container = let(type_=Body, domain=[world.bodies[1]], name="container")
+        handle = let(type_=Body, domain=[world.bodies[3]], name="handle")
+        missing = let(type_=Body, domain=[Body("Missing")], name="missing")
+
+        # both bodies are resolved by a single query of their DAO class
+        query = an(entity(fixed_connection, and_(fixed_connection.parent == container,
+                                                 fixed_connection.child == handle)))
+        translator, selects = self.count_selects(lambda: eql_to_sql(query, self.session))
+        self.assertEqual(selects, 1)
+
+        result = translator.evaluate()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].parent.name, "Container2")
+        self.assertEqual(result[0].child.name, "Handle2")
+
+        # bodies that are not in the database are not queried again one by one
+        query_with_missing = an(entity(fixed_connection, or_(fixed_connection.parent == container,
+                                                             fixed_connection.child == missing)))
+        _, selects = self.count_selects(lambda: eql_to_sql(query_with_missing, self.session))
+        self.assertEqual(selects, 1)
+
     @unittest.skip("Not finished yet-")
     def test_complicated_equal(self):
         # Create the world with its bodies and connections
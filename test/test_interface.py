@@ -1,11 +1,14 @@
+import sys
 import unittest
 
-from sqlalchemy import create_engine, Engine, select
+from sqlalchemy import create_engine, Engine, select, inspect
 from sqlalchemy.orm import Session, configure_mappers
 
 from classes.example_classes import *
 from classes.sqlalchemy_interface import *
-from ormatic.dao import to_dao, NoDAOFoundDuringParsingError, is_data_column
+from ormatic.dao import to_dao, NoDAOFoundDuringParsingError, is_data_column, get_dao_class, \
+    to_dao_bulk
+from ormatic.custom_types import TypeType
 from ormatic.utils import drop_database
 
 
@@ -207,6 +210,56 @@ class InterfaceTestCase(unittest.TestCase):
         results = self.session.scalars(select(NodeDAO)).all()
         self.assertEqual(len(results), 2)
 
+    def test_deep_node_chain(self):
+        node = Node()
+        for _ in range(sys.getrecursionlimit() * 2):
+            node = Node(parent=node)
+
+        dao = to_dao(node)
+        reconstructed = dao.from_dao()
+
+        depth = 0
+        while dao.parent is not None:
+            dao = dao.parent
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() * 2)
+
+        depth = 0
+        while reconstructed.parent is not None:
+            reconstructed = reconstructed.parent
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() * 2)
+
+    def test_repr(self):
+        pose = Pose(Position(1, 2, 3), Orientation(1, 0, 0, None))
+        self.assertEqual(repr(to_dao(pose)), "PoseDAO(position=PositionDAO(x=1, y=2, z=3), "
+                                             "orientation=OrientationDAO(x=1, y=0, z=0, w=None))")
+
+    def test_to_dao_bulk(self):
+        root = Node()
+        nodes = [Node(parent=root) for _ in range(3)]
+
+        daos = to_dao_bulk(nodes)
+
+        self.assertEqual(len(daos), 3)
+        self.assertEqual(len({id(dao.parent) for dao in daos}), 1)
+        self.session.add_all(daos)
+        self.session.commit()
+
+        queried = self.session.scalars(select(NodeDAO)).all()
+        self.assertEqual(len(queried), 4)
+
+        mixed = to_dao_bulk([Position(1, 2, 3), root, Position(4, 5, 6)])
+        self.assertEqual([type(dao) for dao in mixed], [PositionDAO, NodeDAO, PositionDAO])
+        self.assertEqual([mixed[0].z, mixed[2].z], [3, 6])
+
+    def test_to_dao_bulk_of_dao_class(self):
+        positions = [Position(i, i, i) for i in range(3)]
+        daos = PositionDAO.to_dao_bulk(positions + positions[:1])
+
+        self.assertEqual([dao.x for dao in daos], [0, 1, 2, 0])
+        self.assertIs(daos[0], daos[3])
+
     def test_position_type_wrapper(self):
         wrapper = PositionTypeWrapper(Position)
         dao = PositionTypeWrapperDAO.to_dao(wrapper)
@@ -217,6 +270,22 @@ class InterfaceTestCase(unittest.TestCase):
         result = self.session.scalars(select(PositionTypeWrapperDAO)).one()
         self.assertEqual(result, dao)
 
+    def test_get_columns_and_relationships_from(self):
+        position = Position(1, 2, 3)
+        pose = Pose(Position(4, 5, 6), Orientation(1.0, 2.0, 3.0, None))
+        mapper = inspect(PoseDAO)
+
+        position_dao = PositionDAO()
+        position_dao.get_columns_from(position, inspect(PositionDAO).columns)
+        self.assertEqual((position_dao.x, position_dao.y, position_dao.z), (1, 2, 3))
+        self.assertIsNone(position_dao.id)
+
+        pose_dao = PoseDAO()
+        pose_dao.get_relationships_from(pose, mapper.relationships, {}, {})
+        self.assertIsInstance(pose_dao.position, PositionDAO)
+        self.assertEqual(pose_dao.position.z, 6)
+        self.assertIsInstance(pose_dao.orientation, OrientationDAO)
+
     def test_positions(self):
         p1 = Position(1, 2, 3)
         p2 = Position(2, 3, 4)
@@ -273,6 +342,14 @@ class InterfaceTestCase(unittest.TestCase):
         self.assertEqual(ogs_dao, queried)
         self.assertIsInstance(queried.concept, Bowl)
 
+    def test_type_type_round_trip(self):
+        type_type = TypeType()
+        name = type_type.process_bind_param(Bowl, None)
+        self.assertEqual(name, f"{Bowl.__module__}.{Bowl.__name__}")
+        self.assertIs(type_type.process_result_value(name, None), Bowl)
+        self.assertIsNone(type_type.process_bind_param(None, None))
+        self.assertIsNone(type_type.process_result_value(None, None))
+
     def test_inheriting_from_explicit_mapping(self):
         entity: DerivedEntity = DerivedEntity(name="TestEntity")
 
@@ -290,6 +367,22 @@ class InterfaceTestCase(unittest.TestCase):
         reconstructed = queried_entity.from_dao()
         self.assertEqual(reconstructed, entity)
 
+    def test_inheriting_from_explicit_mapping_with_relationship(self):
+        entity = DerivedPositionedEntity("TestEntity", Position(1, 2, 3), "description")
+
+        entity_dao = DerivedPositionedEntityDAO.to_dao(entity)
+        self.assertIsInstance(entity_dao, DerivedPositionedEntityDAO)
+        self.assertEqual(entity_dao.label, "TestEntity")
+        self.assertIsInstance(entity_dao.position, PositionDAO)
+        self.assertEqual(entity_dao.position.z, 3)
+
+        self.session.add(entity_dao)
+        self.session.commit()
+
+        queried_entity = self.session.scalars(select(DerivedPositionedEntityDAO)).one()
+        reconstructed = queried_entity.from_dao()
+        self.assertEqual(reconstructed, entity)
+
     def test_entity_association(self):
         entity = Entity("TestEntity")
         association = EntityAssociation(entity=entity, a=["a"])
@@ -311,6 +404,10 @@ class InterfaceTestCase(unittest.TestCase):
         p = Pose([1,2,3], "a")
         self.assertRaises(NoDAOFoundDuringParsingError, to_dao, p)
 
+    def test_assertion_in_list(self):
+        positions = Positions([Position(1, 2, 3), NotMappedParent()], [])
+        self.assertRaises(NoDAOFoundDuringParsingError, to_dao, positions)
+
     def test_PositionsSubclassWithAnotherPosition(self):
         position = Position(1, 2, 3)
         obj = PositionsSubclassWithAnotherPosition([position], ["a","b", "c"], position)
@@ -442,12 +539,28 @@ class InterfaceTestCase(unittest.TestCase):
         self.assertEqual(child_from_dao, child)
         self.assertEqual(parent_from_dao, parent)
 
+    def test_get_dao_class(self):
+        self.assertIs(get_dao_class(Position), PositionDAO)
+        self.assertIs(get_dao_class(Position4D), Position4DDAO)
+        self.assertIs(get_dao_class(Entity), CustomEntityDAO)
+        self.assertIs(get_dao_class(CustomEntity), CustomEntityDAO)
+        self.assertIsNone(get_dao_class(NotMappedParent))
+
     def test_private_factories(self):
         obj = PrivateDefaultFactory()
         dao = to_dao(obj)
         reconstructed: PrivateDefaultFactory = dao.from_dao()
         self.assertEqual(reconstructed._private_list, [])
 
+    def test_dataclass_with_custom_init(self):
+        obj = DataclassWithCustomInit(3)
+        dao = to_dao(obj)
+        self.assertEqual(dao.doubled_x, 6)
+
+        reconstructed: DataclassWithCustomInit = dao.from_dao()
+        self.assertEqual(reconstructed, obj)
+        self.assertTrue(reconstructed.initialized)
+
 
 if __name__ == '__main__':
     unittest.main()